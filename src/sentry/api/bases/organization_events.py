@@ -58,14 +58,29 @@ class OrganizationEventsEndpointBase(OrganizationEndpoint):
             )
         )
 
+    def get_field_and_equation_lists(
+        self, organization: Organization, request: Request
+    ) -> tuple[list[str], list[str]]:
+        """Partitions the requested fields into (fields, equations) in a single pass.
+
+        Equations have a prefix so that they can be easily included alongside our
+        existing fields.
+        """
+        field_list: list[str] = []
+        equation_list: list[str] = []
+        for field in request.GET.getlist("field"):
+            if is_equation(field):
+                equation_list.append(strip_equation(field))
+            else:
+                field_list.append(field)
+        return field_list, equation_list
+
     def get_equation_list(self, organization: Organization, request: Request) -> list[str]:
         """equations have a prefix so that they can be easily included alongside our existing fields"""
-        return [
-            strip_equation(field) for field in request.GET.getlist("field")[:] if is_equation(field)
-        ]
+        return self.get_field_and_equation_lists(organization, request)[1]
 
     def get_field_list(self, organization: Organization, request: Request) -> list[str]:
-        return [field for field in request.GET.getlist("field")[:] if not is_equation(field)]
+        return self.get_field_and_equation_lists(organization, request)[0]
 
     def get_team_ids(self, request: Request, organization: Organization) -> list[int]:
         return [team.id for team in self.get_teams(request, organization)]
@@ -96,38 +111,41 @@ class OrganizationEventsEndpointBase(OrganizationEndpoint):
         quantize_date_params: bool = True,
     ) -> SnubaParams:
         """Returns params to make snuba queries with"""
-        with sentry_sdk.start_span(op="discover.endpoint", description="filter_params(dataclass)"):
-            if (
-                len(self.get_field_list(organization, request))
-                + len(self.get_equation_list(organization, request))
-                > MAX_FIELDS
-            ):
-                raise ParseError(
-                    detail=f"You can view up to {MAX_FIELDS} fields at a time. Please delete some and try again."
-                )
-
-            filter_params: dict[str, Any] = self.get_filter_params(request, organization)
-            if quantize_date_params:
-                filter_params = self.quantize_date_params(request, filter_params)
-            params = SnubaParams(
-                start=filter_params["start"],
-                end=filter_params["end"],
-                environments=filter_params.get("environment_objects", []),
-                projects=filter_params["project_objects"],
-                user=request.user if request.user else None,
-                teams=self.get_teams(request, organization),
-                organization=organization,
+        # Not worth a tracing span: the dataclass construction is microsecond-scale and the
+        # project fetch inside get_filter_params is already instrumented.
+        # Go through get_field_list/get_equation_list rather than the combined helper so
+        # subclass overrides (e.g. the replay events meta endpoint) still apply here.
+        if (
+            len(self.get_field_list(organization, request))
+            + len(self.get_equation_list(organization, request))
+            > MAX_FIELDS
+        ):
+            raise ParseError(
+                detail=f"You can view up to {MAX_FIELDS} fields at a time. Please delete some and try again."
             )
 
-            if check_global_views:
-                has_global_views = features.has(
-                    "organizations:global-views", organization, actor=request.user
-                )
-                fetching_replay_data = request.headers.get("X-Sentry-Replay-Request") == "1"
-                if not has_global_views and len(params.projects) > 1 and not fetching_replay_data:
-                    raise ParseError(detail="You cannot view events from multiple projects.")
+        filter_params: dict[str, Any] = self.get_filter_params(request, organization)
+        if quantize_date_params:
+            filter_params = self.quantize_date_params(request, filter_params)
+        params = SnubaParams(
+            start=filter_params["start"],
+            end=filter_params["end"],
+            environments=filter_params.get("environment_objects", []),
+            projects=filter_params["project_objects"],
+            user=request.user if request.user else None,
+            teams=self.get_teams(request, organization),
+            organization=organization,
+        )
 
-            return params
+        if check_global_views:
+            has_global_views = features.has(
+                "organizations:global-views", organization, actor=request.user
+            )
+            fetching_replay_data = request.headers.get("X-Sentry-Replay-Request") == "1"
+            if not has_global_views and len(params.projects) > 1 and not fetching_replay_data:
+                raise ParseError(detail="You cannot view events from multiple projects.")
+
+        return params
 
     def get_orderby(self, request: Request) -> Sequence[str] | None:
         sort = request.GET.getlist("sort")
@@ -394,13 +394,17 @@ class OrganizationEventsEndpoint(OrganizationEventsV2EndpointBase):
                 )
             referrer = Referrer.API_ORGANIZATION_EVENTS.value
 
+        # The requested fields don't change over the lifetime of the request, so parse them
+        # once here instead of once per page and per split-decision query.
+        field_list, equation_list = self.get_field_and_equation_lists(organization, request)
+
         def _data_fn(scoped_dataset, offset, limit, query) -> dict[str, Any]:
             query_source = self.get_request_source(request)
             return scoped_dataset.query(
-                selected_columns=self.get_field_list(organization, request),
+                selected_columns=field_list,
                 query=query,
                 snuba_params=snuba_params,
-                equations=self.get_equation_list(organization, request),
+                equations=equation_list,
                 orderby=self.get_orderby(request),
                 offset=offset,
                 limit=limit,
@@ -441,15 +445,23 @@ class OrganizationEventsEndpoint(OrganizationEventsV2EndpointBase):
 
                     return _data_fn(split_dataset, offset, limit, scoped_query)
 
-                try:
-                    error_results = _data_fn(errors, offset, limit, scoped_query)
-                    # Widget has not split the discover dataset yet, so we need to check if there are errors etc.
-                    has_errors = len(error_results["data"]) > 0
-                except SnubaError:
-                    has_errors = False
-                    error_results = None
+                # Widget has not split the discover dataset yet, so we need to check if there
+                # are errors etc. Both queries are independent Snuba calls, so issue them
+                # concurrently rather than paying for two roundtrips back to back.
+                with ThreadPoolExecutor(max_workers=2) as exe:
+                    errors_future = exe.submit(_data_fn, errors, offset, limit, scoped_query)
+                    original_future = exe.submit(
+                        _data_fn, scoped_dataset, offset, limit, scoped_query
+                    )
+
+                    try:
+                        error_results = errors_future.result()
+                        has_errors = bool(error_results["data"])
+                    except SnubaError:
+                        has_errors = False
+                        error_results = None
 
-                original_results = _data_fn(scoped_dataset, offset, limit, scoped_query)
+                    original_results = original_future.result()
                 if original_results.get("data") is not None:
                     dataset_meta = original_results.get("meta", {})
                 else:
@@ -457,7 +469,7 @@ class OrganizationEventsEndpoint(OrganizationEventsV2EndpointBase):
                 using_metrics = dataset_meta.get("isMetricsData", False) or dataset_meta.get(
                     "isMetricsExtractedData", False
                 )
-                has_other_data = len(original_results["data"]) > 0
+                has_other_data = bool(original_results["data"])
 
                 has_transactions = has_other_data
                 transaction_results = None
@@ -465,7 +477,7 @@ class OrganizationEventsEndpoint(OrganizationEventsV2EndpointBase):
                     # In the case that the original request was not using the metrics dataset, we cannot be certain that other data is solely transactions.
                     sentry_sdk.set_tag("third_split_query", True)
                     transaction_results = _data_fn(transactions, offset, limit, scoped_query)
-                    has_transactions = len(transaction_results["data"]) > 0
+                    has_transactions = bool(transaction_results["data"])
 
                 decision = self.save_split_decision(
                     widget, has_errors, has_transactions, organization, request.user
@@ -503,7 +515,7 @@ class OrganizationEventsEndpoint(OrganizationEventsV2EndpointBase):
                     return _data_fn(scoped_dataset, offset, limit, scoped_query)
 
                 dataset_inferred_from_query = dataset_split_decision_inferred_from_query(
-                    self.get_field_list(organization, request),
+                    field_list,
                     scoped_query,
                 )
                 has_errors = False
@@ -559,7 +571,7 @@ class OrganizationEventsEndpoint(OrganizationEventsV2EndpointBase):
                         ] = DiscoverSavedQueryTypes.get_type_name(
                             DiscoverSavedQueryTypes.ERROR_EVENTS
                         )
-                        has_errors = len(error_results["data"]) > 0
+                        has_errors = bool(error_results["data"])
                     except KeyError:
                         error_results = None
 
@@ -570,7 +582,7 @@ class OrganizationEventsEndpoint(OrganizationEventsV2EndpointBase):
                         ] = DiscoverSavedQueryTypes.get_type_name(
                             DiscoverSavedQueryTypes.TRANSACTION_LIKE
                         )
-                        has_transactions = len(transaction_results["data"]) > 0
+                        has_transactions = bool(transaction_results["data"])
                     except KeyError:
                         transaction_results = None
 
@@ -283,10 +283,13 @@ class OrganizationEventsStatsEndpoint(OrganizationEventsV2EndpointBase):
             comparison_delta: datetime | None,
         ) -> SnubaTSResult | dict[str, SnubaTSResult]:
             if top_events > 0:
+                field_list, equation_list = self.get_field_and_equation_lists(
+                    organization, request
+                )
                 return scoped_dataset.top_events_timeseries(
                     timeseries_columns=query_columns,
-                    selected_columns=self.get_field_list(organization, request),
-                    equations=self.get_equation_list(organization, request),
+                    selected_columns=field_list,
+                    equations=equation_list,
                     user_query=query,
                     snuba_params=snuba_params,
                     orderby=self.get_orderby(request),
@@ -50,9 +50,10 @@ def delete_group_list(
     call_delete_seer_grouping_records_by_hash(group_ids)
 
     # We do not want to delete split hashes as they are necessary for keeping groups... split.
+    # `with_post_update_signal` so the denormalized group on GroupHashMetadata gets cleared too.
     GroupHash.objects.filter(
         project_id=project.id, group__id__in=group_ids, state=GroupHash.State.SPLIT
-    ).update(group=None)
+    ).with_post_update_signal(True).update(group=None)
     GroupHash.objects.filter(project_id=project.id, group__id__in=group_ids).exclude(
         state=GroupHash.State.SPLIT
     ).delete()
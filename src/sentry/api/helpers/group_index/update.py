@@ -92,7 +92,9 @@ def handle_discard(
             else:
                 groups_to_delete[group.project_id].append(group)
 
-                GroupHash.objects.filter(group=group).update(
+                # `with_post_update_signal` so the denormalized group on
+                # GroupHashMetadata gets re-synced.
+                GroupHash.objects.filter(group=group).with_post_update_signal(True).update(
                     group=None, group_tombstone_id=tombstone.id
                 )
 
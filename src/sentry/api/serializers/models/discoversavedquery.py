@@ -4,7 +4,12 @@ from typing import DefaultDict, TypedDict
 from sentry.api.serializers import Serializer, register
 from sentry.api.serializers.models.user import UserSerializerResponse
 from sentry.constants import ALL_ACCESS_PROJECTS
-from sentry.discover.models import DatasetSourcesTypes, DiscoverSavedQuery, DiscoverSavedQueryTypes
+from sentry.discover.models import (
+    DatasetSourcesTypes,
+    DiscoverSavedQuery,
+    DiscoverSavedQueryProject,
+    DiscoverSavedQueryTypes,
+)
 from sentry.users.services.user.service import user_service
 from sentry.utils.dates import outside_retention_with_modified_start, parse_timestamp
 
@@ -59,10 +64,19 @@ class DiscoverSavedQueryModelSerializer(Serializer):
         )
         serialized_users = {user["id"]: user for user in service_serialized}
 
+        project_ids_by_query_id: DefaultDict[int, list[int]] = defaultdict(list)
+        for query_id, project_id in DiscoverSavedQueryProject.objects.filter(
+            discover_saved_query__in=item_list
+        ).values_list("discover_saved_query_id", "project_id"):
+            project_ids_by_query_id[query_id].append(project_id)
+
         for discover_saved_query in item_list:
             result[discover_saved_query]["created_by"] = serialized_users.get(
                 str(discover_saved_query.created_by_id)
             )
+            result[discover_saved_query]["projects"] = project_ids_by_query_id[
+                discover_saved_query.id
+            ]
 
         return result
 
@@ -87,7 +101,7 @@ class DiscoverSavedQueryModelSerializer(Serializer):
         data: DiscoverSavedQueryResponse = {
             "id": str(obj.id),
             "name": obj.name,
-            "projects": [project.id for project in obj.projects.all()],
+            "projects": attrs.get("projects", []),
             "version": obj.version or obj.query.get("version", 1),
             "queryDataset": DiscoverSavedQueryTypes.get_type_name(obj.dataset),
             "datasetSource": DATASET_SOURCES[obj.dataset_source],
@@ -1543,9 +1543,11 @@ def _save_aggregate(
                 else:
                     new_hashes = list(flat_grouphashes)
 
+                # `with_post_update_signal` so the denormalized group on GroupHashMetadata
+                # gets synced for any hashes that already have metadata rows.
                 GroupHash.objects.filter(id__in=[h.id for h in new_hashes]).exclude(
                     state=GroupHash.State.LOCKED_IN_MIGRATION
-                ).update(group=group)
+                ).with_post_update_signal(True).update(group=group)
 
                 is_new = not seer_matched_group
                 is_regression = (
@@ -1673,9 +1675,11 @@ def _save_aggregate(
         # _save_aggregate had races around group creation which made this race
         # more user visible. For more context, see 84c6f75a and d0e22787, as
         # well as GH-5085.
+        # `with_post_update_signal` so the denormalized group on GroupHashMetadata
+        # gets synced for any hashes that already have metadata rows.
         GroupHash.objects.filter(id__in=[h.id for h in new_hashes]).exclude(
             state=GroupHash.State.LOCKED_IN_MIGRATION
-        ).update(group=group)
+        ).with_post_update_signal(True).update(group=group)
 
     is_regression = _process_existing_aggregate(
         group=group,
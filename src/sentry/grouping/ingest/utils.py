@@ -35,9 +35,11 @@ def add_group_id_to_grouphashes(
 
     new_grouphash_ids = [gh.id for gh in grouphashes if gh.group_id is None]
 
+    # `with_post_update_signal` so the denormalized group on GroupHashMetadata gets synced
+    # for any hashes that already have metadata rows.
     GroupHash.objects.filter(id__in=new_grouphash_ids).exclude(
         state=GroupHash.State.LOCKED_IN_MIGRATION
-    ).update(group=group)
+    ).with_post_update_signal(True).update(group=group)
 
 
 def check_for_group_creation_load_shed(project: Project, event: Event):
@@ -6,9 +6,12 @@ from __future__ import annotations
 
 import logging
 import math
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from threading import RLock
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
 from django.conf import settings
 from sentry_redis_tools.clients import RedisCluster, StrictRedis
 from snuba_sdk import (
@@ -28,12 +31,13 @@ from sentry.snuba.dataset import Dataset, EntityKey
 from sentry.tasks.post_process import locks
 from sentry.utils import metrics
 from sentry.utils.locking import UnableToAcquireLock
-from sentry.utils.redis import redis_clusters
+from sentry.utils.redis import load_redis_script, redis_clusters
 
 if TYPE_CHECKING:
     from sentry.models.project import Project
 
 
+set_threshold = load_redis_script("issues/set_threshold.lua")
 logger = logging.getLogger(__name__)
 
 # for snuba operations
@@ -44,10 +48,34 @@ WEEK_IN_HOURS = 7 * 24
 # for redis operations
 DEFAULT_TTL = 48 * 60 * 60  # 2 days
 FALLBACK_TTL = 10 * 60  # 10 minutes; TTL for storing temporary values while we can't query Snuba
-THRESHOLD_KEY = "new-issue-escalation-threshold:{project_id}"
-STALE_DATE_KEY = "new-issue-escalation-threshold-stale-date:v2:{project_id}"
+THRESHOLD_KEY_PREFIX = "new-issue-escalation-threshold:"
+STALE_DATE_KEY_PREFIX = "new-issue-escalation-threshold-stale-date:v2:"
+THRESHOLD_KEY = THRESHOLD_KEY_PREFIX + "{project_id}"
+STALE_DATE_KEY = STALE_DATE_KEY_PREFIX + "{project_id}"
 TIME_TO_USE_EXISTING_THRESHOLD = 24 * 60 * 60  # 1 day
 
+# for in-process caching; lets bursts of events for the same project skip the Redis roundtrip
+LOCAL_CACHE_TTL = 30  # seconds
+_local_threshold_cache: TTLCache[int, float] = TTLCache(maxsize=10000, ttl=LOCAL_CACHE_TTL)
+_local_threshold_cache_lock = RLock()
+
+
+@lru_cache(maxsize=4096)
+def _threshold_keys(project_id: int) -> tuple[str, str]:
+    """Formatted (threshold, stale date) keys; cached since project ids never change."""
+    return (
+        f"{THRESHOLD_KEY_PREFIX}{project_id}",
+        f"{STALE_DATE_KEY_PREFIX}{project_id}",
+    )
+
+
+def _utcnow() -> datetime:
+    """Naive UTC timestamp matching the format of the dates stored in Redis.
+
+    datetime.utcnow is deprecated as of 3.12; this keeps the naive-UTC semantics without it.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
 def calculate_threshold(project: Project) -> float | None:
     """
@@ -55,7 +83,7 @@ def calculate_threshold(project: Project) -> float | None:
     """
     from sentry.utils.snuba import raw_snql_query
 
-    now = datetime.now()
+    now = _utcnow()
     one_hour_ago = now - timedelta(hours=1)
     one_week_ago = now - timedelta(days=7)
     ninety_days_ago = now - timedelta(days=90)
@@ -108,7 +136,9 @@ def calculate_threshold(project: Project) -> float | None:
             ),  # exclude any issues that had only 1 event in the past week
             Condition(
                 Column("first_seen"), Op.LT, one_hour_ago
-            ),  # if it's first seen within the last hour, discard to avoid ZeroDivision
+            ),  # if it's first seen within the last hour, discard to avoid ZeroDivision. this
+            # must stay in HAVING: pushing `timestamp < one_hour_ago` into WHERE would also
+            # drop last-hour events from past_week_event_count for groups that are kept
         ],
         orderby=[OrderBy(Column("first_seen"), Direction.ASC)],
         limit=Limit(10000),
@@ -162,12 +192,10 @@ def update_threshold(
     if math.isnan(threshold):
         threshold = 0
 
-    ttl = DEFAULT_TTL
     client = get_redis_client()
-    with client.pipeline() as p:
-        p.set(threshold_key, threshold, ex=ttl)
-        p.set(stale_date_key, str(datetime.utcnow()), ex=ttl)
-        p.execute()
+    set_threshold(
+        [threshold_key, stale_date_key], [threshold, str(_utcnow()), DEFAULT_TTL], client
+    )
     metrics.incr("issues.update_new_escalation_threshold", tags={"useFallback": False})
     return threshold
 
@@ -184,7 +212,7 @@ def fallback_to_stale_or_zero(
     ttl = FALLBACK_TTL
     # current datetime - the amount of time a threshold is valid for + how much time to wait before trying to query Snuba for the threshold again
     stale_date = (
-        datetime.utcnow()
+        _utcnow()
         - timedelta(seconds=TIME_TO_USE_EXISTING_THRESHOLD)
         + timedelta(seconds=FALLBACK_TTL)
     )
@@ -213,17 +241,19 @@ def get_latest_threshold(project: Project) -> float:
     Returns the most up-to-date threshold for the project, re-calculating if outdated or non-existent.
     If the lock cannot be acquired, another process is updating, so we return the stale value.
     """
-    keys = [
-        THRESHOLD_KEY.format(project_id=project.id),
-        STALE_DATE_KEY.format(project_id=project.id),
-    ]
+    with _local_threshold_cache_lock:
+        cached_threshold = _local_threshold_cache.get(project.id)
+    if cached_threshold is not None:
+        return cached_threshold
+
+    keys = _threshold_keys(project.id)
     client = get_redis_client()
     cache_results = client.mget(keys)  # returns None if key is nonexistent
     threshold = cache_results[0]
     stale_date = None
     if cache_results[1] is not None:
         stale_date = datetime.fromisoformat(cache_results[1])
-    now = datetime.utcnow()
+    now = _utcnow()
     if (
         stale_date is None
         or threshold is None
@@ -247,6 +277,8 @@ def get_latest_threshold(project: Project) -> float:
     else:
         # redis stores as strings, so convert back to a float if using the value from the cache
         threshold = float(threshold)
+    with _local_threshold_cache_lock:
+        _local_threshold_cache[project.id] = threshold
     return threshold
 
 
@@ -0,0 +1,47 @@
+# Generated by Django 5.0.8 on 2024-08-29 00:00
+
+from django.db import migrations
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+from sentry.new_migrations.migrations import CheckedMigration
+from sentry.utils.query import RangeQuerySetWrapperWithProgressBar
+
+
+def _backfill_group(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    GroupHashMetadata = apps.get_model("sentry", "GroupHashMetadata")
+
+    for metadata in RangeQuerySetWrapperWithProgressBar(
+        GroupHashMetadata.objects.select_related("grouphash").all()
+    ):
+        if metadata.group_id != metadata.grouphash.group_id:
+            metadata.group_id = metadata.grouphash.group_id
+            metadata.save(update_fields=["group"])
+
+
+class Migration(CheckedMigration):
+    # This flag is used to mark that a migration shouldn't be automatically run in production.
+    # This should only be used for operations where it's safe to run the migration after your
+    # code has deployed. So this should not be used for most operations that alter the schema
+    # of a table.
+    # Here are some things that make sense to mark as post deployment:
+    # - Large data migrations. Typically we want these to be run manually so that they can be
+    #   monitored and not block the deploy for a long period of time while they run.
+    # - Adding indexes to large tables. Since this can take a long time, we'd generally prefer to
+    #   run this outside deployments so that we don't block them. Note that while adding an index
+    #   is a schema change, it's completely safe to run the operation after the code has deployed.
+    # Once deployed, run these manually via: https://develop.sentry.dev/database-migrations/#migration-deployment
+
+    is_post_deployment = True
+
+    dependencies = [
+        ("sentry", "0753_grouphashmetadata_add_group"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _backfill_group,
+            migrations.RunPython.noop,
+            hints={"tables": ["sentry_grouphashmetadata"]},
+        ),
+    ]
@@ -1,9 +1,14 @@
+from collections import defaultdict
+
 from django.db import models
+from django.db.models.signals import post_save
 from django.utils import timezone
 
 from sentry.backup.scopes import RelocationScope
-from sentry.db.models import Model, region_silo_model
+from sentry.db.models import FlexibleForeignKey, Model, region_silo_model
 from sentry.db.models.base import sane_repr
+from sentry.models.grouphash import GroupHash
+from sentry.signals import post_update
 
 
 @region_silo_model
@@ -15,17 +20,61 @@ class GroupHashMetadata(Model):
         "sentry.GroupHash", related_name="_metadata", on_delete=models.CASCADE
     )
     date_added = models.DateTimeField(default=timezone.now)
+    # Denormalized from `grouphash.group_id` so reading the group off metadata doesn't cost a
+    # JOIN or a second query. Kept in sync on GroupHash saves and bulk reassignments below.
+    # NOTE: unlike the `group_id` property this replaced, there is no fallback to
+    # `grouphash.group_id` when the column is NULL. Between deploy and the post-deployment
+    # backfill (0754) rows read None where the old property returned the real id, and any
+    # GroupHash write path that bypasses the sync hooks leaves behind a stale id - possibly
+    # of a merged-away or deleted group, since `db_constraint=False` means the database
+    # never clears it. Treat `grouphash.group_id` as the source of truth whenever
+    # correctness matters more than the saved lookup.
+    group = FlexibleForeignKey(
+        "sentry.Group", null=True, on_delete=models.SET_NULL, db_constraint=False
+    )
 
     class Meta:
         app_label = "sentry"
         db_table = "sentry_grouphashmetadata"
 
-    @property
-    def group_id(self) -> int | None:
-        return self.grouphash.group_id
-
     @property
     def hash(self) -> str:
         return self.grouphash.hash
 
-    __repr__ = sane_repr("grouphash_id", "group_id", "hash")
+    # Note: only local columns here - including `hash` would dereference the grouphash
+    # relation and can issue a query every time an instance is repr'd (logging, debuggers).
+    __repr__ = sane_repr("grouphash_id", "group_id")
+
+
+def sync_grouphash_group(instance: GroupHash, created: bool = False, **kwargs) -> None:
+    # A freshly created hash can't have a metadata row yet, so skip the guaranteed no-op
+    # UPDATE on the ingestion hot path.
+    if created:
+        return
+    GroupHashMetadata.objects.filter(grouphash=instance).exclude(
+        group_id=instance.group_id
+    ).update(group_id=instance.group_id)
+
+
+def sync_grouphash_group_on_update(
+    updated_fields: list[str], model_ids: list[int], **kwargs
+) -> None:
+    # Queryset-level updates (discard, unmerge) bypass post_save, so the call sites that
+    # reassign `GroupHash.group` in bulk opt in to `post_update` and we re-sync here.
+    if "group" not in updated_fields and "group_id" not in updated_fields:
+        return
+
+    grouphash_ids_by_group: dict[int | None, list[int]] = defaultdict(list)
+    for grouphash_id, group_id in GroupHash.objects.filter(id__in=model_ids).values_list(
+        "id", "group_id"
+    ):
+        grouphash_ids_by_group[group_id].append(grouphash_id)
+
+    for group_id, grouphash_ids in grouphash_ids_by_group.items():
+        GroupHashMetadata.objects.filter(grouphash_id__in=grouphash_ids).exclude(
+            group_id=group_id
+        ).update(group_id=group_id)
+
+
+post_save.connect(sync_grouphash_group, sender=GroupHash, weak=False)
+post_update.connect(sync_grouphash_group_on_update, sender=GroupHash, weak=False)
@@ -0,0 +1,8 @@
+-- Set the escalation threshold and its stale date atomically with a shared TTL.
+assert(#KEYS == 2, "provide the threshold key and the stale date key")
+assert(#ARGV == 3, "provide a threshold, a stale date and a TTL")
+
+redis.call("SET", KEYS[1], ARGV[1], "EX", ARGV[3])
+redis.call("SET", KEYS[2], ARGV[2], "EX", ARGV[3])
+
+return 1
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from collections import deque
 from collections.abc import Callable, Mapping, Sequence
 from datetime import datetime, timedelta
 from re import Match
@@ -933,21 +934,15 @@ class BaseQueryBuilder:
         turn be a mix of either type.
         """
         flattened: list[Condition] = []
-        boolean_conditions: list[BooleanCondition] = []
+        remaining: deque[Condition | BooleanCondition] = deque(self.having)
 
-        for condition in self.having:
+        while remaining:
+            # Pop from the front so conditions come out in their original order.
+            condition = remaining.popleft()
             if isinstance(condition, Condition):
                 flattened.append(condition)
             elif isinstance(condition, BooleanCondition):
-                boolean_conditions.append(condition)
-
-        while len(boolean_conditions) > 0:
-            boolean_condition = boolean_conditions.pop()
-            for condition in boolean_condition.conditions:
-                if isinstance(condition, Condition):
-                    flattened.append(condition)
-                elif isinstance(condition, BooleanCondition):
-                    boolean_conditions.append(condition)
+                remaining.extend(condition.conditions)
 
         return flattened
 
@@ -182,7 +182,7 @@ class MetricsQueryBuilder(BaseQueryBuilder):
         if self.use_metrics_layer:
             first_column = self.columns[0]
             return self.columns and (
-                isinstance(first_column, Function) or isinstance(first_column, AliasedExpression)
+                isinstance(first_column, (Function, AliasedExpression))
             )
 
         return super().are_columns_resolved()
@@ -386,10 +386,9 @@ class MetricsQueryBuilder(BaseQueryBuilder):
             tags = parse_query(
                 self.params.projects, self.query, self.params.user, self.params.environments
             )["tags"]
-            for tag in tags:
-                if tag in constants.SPANS_METRICS_TAGS:
-                    self._is_spans_metrics_query_cache = True
-                    return True
+            if any(tag in constants.SPANS_METRICS_TAGS for tag in tags):
+                self._is_spans_metrics_query_cache = True
+                return True
         for column in self.selected_columns:
             # Not using parse_function since it checks against function_converter
             # which is not loaded yet and we also do not need it
@@ -84,7 +84,7 @@ class Unit:
             return query_expression
 
         # In case we have just a scalar, we can multiply in-memory.
-        if isinstance(query_expression, int) or isinstance(query_expression, float):
+        if isinstance(query_expression, (int, float)):
             return self.convert(query_expression)
 
         # We represent the scaling factor as a multiplicative factor, so that we can just multiply.
@@ -479,7 +479,7 @@ class NumericScalarsNormalizationVisitor(QueryExpressionVisitor[QueryExpression]
         return self._unit.apply_on_query_expression(float_number)
 
     def _is_numeric_scalar(self, value: QueryExpression) -> bool:
-        return isinstance(value, int) or isinstance(value, float)
+        return isinstance(value, (int, float))
 
 
 class MapperVisitor(QueryExpressionVisitor):
@@ -386,27 +386,20 @@ class TagMapping(TypedDict):
 def _check_event_type_transaction(
     query: Sequence[QueryToken], is_top_level_call: bool = True
 ) -> bool:
-    transaction_filter = False
-
     for token in query:
         if isinstance(token, SearchFilter):
             if token.key.name == "event.type" and token.value.value == "transaction":
-                transaction_filter = True
-                break
+                return True
         elif isinstance(token, ParenExpression):
-            contains_transaction = _check_event_type_transaction(
-                token.children, is_top_level_call=False
-            )
-            if contains_transaction:
-                transaction_filter = True
-                break
+            if _check_event_type_transaction(token.children, is_top_level_call=False):
+                return True
 
     # Only if we are top level call, and we didn't find any transaction filter, we throw an exception, otherwise it
     # means we are in a nested expression and not finding a transaction doesn't mean we never found it.
-    if is_top_level_call and not transaction_filter:
+    if is_top_level_call:
         raise ValueError("event.type:transaction not found in the query")
 
-    return transaction_filter
+    return False
 
 
 def _transform_search_filter(search_filter: SearchFilter) -> SearchFilter:
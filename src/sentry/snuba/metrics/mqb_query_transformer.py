@@ -20,6 +20,9 @@ from sentry.snuba.metrics.query_builder import FUNCTION_ALLOWLIST
 
 TEAM_KEY_TRANSACTION_OP = "team_key_transaction"
 
+# columns whose conditions are lifted straight into MetricsQuery params
+_MQ_DICT_PARAM_COLUMNS = {"project_id": "project_ids", "org_id": "org_id"}
+
 
 class MQBQueryTransformationException(Exception):
     ...
@@ -189,10 +192,9 @@ def _get_mq_dict_params_and_conditions_from(conditions):
                 BooleanCondition(op=condition.op, conditions=inner_conditions)
             )
         elif isinstance(condition.lhs, Column):
-            if condition.lhs.name == "project_id":
-                mq_dict["project_ids"] = condition.rhs
-            elif condition.lhs.name == "org_id":
-                mq_dict["org_id"] = condition.rhs
+            mq_key = _MQ_DICT_PARAM_COLUMNS.get(condition.lhs.name)
+            if mq_key is not None:
+                mq_dict[mq_key] = condition.rhs
             elif condition.lhs.name == "timestamp":
                 if condition.op == Op.GTE:
                     mq_dict["start"] = condition.rhs
@@ -360,7 +360,7 @@ def resolve_tags(
 
     if isinstance(input_, BooleanCondition):
         additional_args = {"op": input_.op}
-        if isinstance(input_, Or) or isinstance(input_, And):
+        if isinstance(input_, (Or, And)):
             # In case we use `Or` or `And`, the operation doesn't need to be injected.
             additional_args = {}
 
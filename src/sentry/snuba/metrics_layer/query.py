@@ -467,7 +467,7 @@ def _lookup_resolve_filters(
     def lookup_resolve_exp(
         exp: FilterTypes, dataset: str, reverse_mappings: ReverseMappings
     ) -> None:
-        if dataset == Dataset.Metrics.value and (isinstance(exp, str) or isinstance(exp, list)):
+        if dataset == Dataset.Metrics.value and isinstance(exp, (str, list)):
             if isinstance(exp, str):
                 resolved = resolve_weak(use_case_id, org_id, exp)
                 if resolved > -1:
@@ -37,57 +37,61 @@ DATASET_OPTIONS = {
 DATASET_LABELS = {value: key for key, value in DATASET_OPTIONS.items()}
 
 
-TRANSACTION_ONLY_FIELDS = [
-    "transaction.duration",
-    "transaction.op",
-    "transaction.status",
-    "measurements.lcp",
-    "measurements.cls",
-    "measurements.fcp",
-    "measurements.fid",
-    "measurements.inp",
-    "measurements.ttfb.requesttime",
-    "measurements.app_start_cold",
-    "measurements.app_start_warm",
-    "measurements.frames_total",
-    "measurements.frames_slow",
-    "measurements.frames_frozen",
-    "measurements.frames_slow_rate",
-    "measurements.frames_frozen_rate",
-    "measurements.stall_count",
-    "measurements.stall_total_time",
-    "measurements.stall_longest_time",
-    "measurements.stall_percentage",
-    "measurements.time_to_full_display",
-    "measurements.time_to_initial_display",
-    "spans.browser",
-    "spans.http",
-    "spans.db",
-    "spans.resource",
-    "spans.ui",
-]
-
-ERROR_ONLY_FIELDS = [
-    "location",
-    "error.type",
-    "error.value",
-    "error.mechanism",
-    "error.handled",
-    "error.unhandled",
-    "error.received",
-    "error.main_thread",
-    "level",
-    "stack.abs_path",
-    "stack.colno",
-    "stack.filename",
-    "stack.function",
-    "stack.in_app",
-    "stack.lineno",
-    "stack.module",
-    "stack.package",
-    "stack.resource",
-    "stack.stack_level",
-]
+TRANSACTION_ONLY_FIELDS = frozenset(
+    {
+        "transaction.duration",
+        "transaction.op",
+        "transaction.status",
+        "measurements.lcp",
+        "measurements.cls",
+        "measurements.fcp",
+        "measurements.fid",
+        "measurements.inp",
+        "measurements.ttfb.requesttime",
+        "measurements.app_start_cold",
+        "measurements.app_start_warm",
+        "measurements.frames_total",
+        "measurements.frames_slow",
+        "measurements.frames_frozen",
+        "measurements.frames_slow_rate",
+        "measurements.frames_frozen_rate",
+        "measurements.stall_count",
+        "measurements.stall_total_time",
+        "measurements.stall_longest_time",
+        "measurements.stall_percentage",
+        "measurements.time_to_full_display",
+        "measurements.time_to_initial_display",
+        "spans.browser",
+        "spans.http",
+        "spans.db",
+        "spans.resource",
+        "spans.ui",
+    }
+)
+
+ERROR_ONLY_FIELDS = frozenset(
+    {
+        "location",
+        "error.type",
+        "error.value",
+        "error.mechanism",
+        "error.handled",
+        "error.unhandled",
+        "error.received",
+        "error.main_thread",
+        "level",
+        "stack.abs_path",
+        "stack.colno",
+        "stack.filename",
+        "stack.function",
+        "stack.in_app",
+        "stack.lineno",
+        "stack.module",
+        "stack.package",
+        "stack.resource",
+        "stack.stack_level",
+    }
+)
 
 
 def get_dataset(dataset_label: str) -> Any | None:
@@ -123,26 +127,29 @@ def build_query_strings(
     )
 
 
+# built once at import; ordered so the errors bias of the split decision is preserved
+_FIELDS_BY_DECISION = (
+    (ERROR_ONLY_FIELDS, DiscoverSavedQueryTypes.ERROR_EVENTS),
+    (TRANSACTION_ONLY_FIELDS, DiscoverSavedQueryTypes.TRANSACTION_LIKE),
+)
+
+
+def _dataset_inferred_from_string(text):
+    for fields, decision in _FIELDS_BY_DECISION:
+        if any(field in text for field in fields):
+            return decision
+
+    return None
+
+
 def dataset_split_decision_inferred_from_query(columns, query):
     """
     Infers split decision based on fields we know exclusively belong to one
     dataset or the other. Biases towards Errors dataset.
     """
-    for field in ERROR_ONLY_FIELDS:
-        if field in query:
-            return DiscoverSavedQueryTypes.ERROR_EVENTS
-
-    for field in TRANSACTION_ONLY_FIELDS:
-        if field in query:
-            return DiscoverSavedQueryTypes.TRANSACTION_LIKE
-
-    for column in columns:
-        for field in ERROR_ONLY_FIELDS:
-            if field in column:
-                return DiscoverSavedQueryTypes.ERROR_EVENTS
-
-        for field in TRANSACTION_ONLY_FIELDS:
-            if field in column:
-                return DiscoverSavedQueryTypes.TRANSACTION_LIKE
+    for text in (query, *columns):
+        decision = _dataset_inferred_from_string(text)
+        if decision is not None:
+            return decision
 
     return None
@@ -39,7 +39,7 @@ from sentry.seer.similarity.utils import (
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.referrer import Referrer
 from sentry.tasks.delete_seer_grouping_records import delete_seer_grouping_records_by_hash
-from sentry.utils import json, metrics
+from sentry.utils import metrics
 from sentry.utils.iterators import chunked
 from sentry.utils.query import RangeQuerySetWrapper
 from sentry.utils.safe import get_path
@@ -71,7 +71,7 @@ def filter_snuba_results(snuba_results, groups_to_backfill_with_no_embedding, pr
             "tasks.backfill_seer_grouping_records.results",
             extra={
                 "project_id": project.id,
-                "group_id_batch": json.dumps(groups_to_backfill_with_no_embedding),
+                "group_id_batch": groups_to_backfill_with_no_embedding,
             },
         )
         return [], []
@@ -312,7 +312,7 @@ def get_events_from_nodestore(
             "tasks.backfill_seer_grouping_records.no_data",
             extra={
                 "project_id": project.id,
-                "group_id_batch": json.dumps(groups_to_backfill_with_no_embedding_has_snuba_row),
+                "group_id_batch": groups_to_backfill_with_no_embedding_has_snuba_row,
             },
         )
         return (
@@ -563,7 +563,7 @@ def _make_nodestore_call(project, node_keys):
         extra = {
             "organization_id": project.organization.id,
             "project_id": project.id,
-            "node_keys": json.dumps(node_keys),
+            "node_keys": node_keys,
             "error": e.message,
         }
         logger.exception(
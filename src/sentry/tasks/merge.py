@@ -202,6 +202,8 @@ def merge_groups(
 
 
 def merge_objects(models, group, new_group, limit=1000, logger=None, transaction_id=None):
+    from sentry.models.grouphash import GroupHash
+
     has_more = False
     for model in models:
         all_fields = [f.name for f in model._meta.get_fields()]
@@ -228,7 +230,11 @@ def merge_objects(models, group, new_group, limit=1000, logger=None, transaction
             try:
                 with transaction.atomic(using=router.db_for_write(model)):
                     if has_group:
-                        project_qs.filter(id=obj.id).update(group=new_group)
+                        update_qs = project_qs.filter(id=obj.id)
+                        if model is GroupHash:
+                            # Keep the denormalized group on GroupHashMetadata in sync.
+                            update_qs = update_qs.with_post_update_signal(True)
+                        update_qs.update(group=new_group)
                     else:
                         project_qs.filter(id=obj.id).update(group_id=new_group.id)
             except IntegrityError:
@@ -115,10 +115,11 @@ class PrimaryHashUnmergeReplacement(UnmergeReplacement):
     def run_postgres_replacement(
         self, project: Project, destination_id: int, locked_primary_hashes: Collection[str]
     ) -> None:
-        # Move the group hashes to the destination.
-        GroupHash.objects.filter(project_id=project.id, hash__in=locked_primary_hashes).update(
-            group=destination_id
-        )
+        # Move the group hashes to the destination. `with_post_update_signal` so the
+        # denormalized group on GroupHashMetadata gets re-synced.
+        GroupHash.objects.filter(
+            project_id=project.id, hash__in=locked_primary_hashes
+        ).with_post_update_signal(True).update(group=destination_id)
 
     def get_activity_args(self) -> Mapping[str, Any]:
         return {"fingerprints": self.fingerprints}
@@ -1399,7 +1399,7 @@ def resolve_column(dataset) -> Callable:
     def _resolve_column(col):
         if col is None:
             return col
-        if isinstance(col, int) or isinstance(col, float):
+        if isinstance(col, (int, float)):
             return col
         if isinstance(col, str) and (col.startswith("tags[") or QUOTED_LITERAL_RE.match(col)):
             return col
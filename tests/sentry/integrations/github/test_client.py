@@ -41,6 +41,194 @@ GITHUB_CODEOWNERS = {
     "raw": "docs/*    @NisanthanNanthakumar   @getsentry/ecosystem\n* @NisanthanNanthakumar\n",
 }
 
+# Expected GraphQL blame queries, hoisted to module scope so each test references a
+# single shared literal instead of rebuilding its own copy.
+EXPECTED_BLAME_QUERY_SINGLE_REPO = """query ($repo_name_0: String!, $repo_owner_0: String!, $ref_0_0: String!, $path_0_0_0: String!, $path_0_0_1: String!) {
+    repository0: repository(name: $repo_name_0, owner: $repo_owner_0) {
+        ref0: ref(qualifiedName: $ref_0_0) {
+            target {
+                ... on Commit {
+                    blame0: blame(path: $path_0_0_0) {
+                        ranges {
+                            commit {
+                                oid
+                                author {
+                                    name
+                                    email
+                                }
+                                message
+                                committedDate
+                            }
+                            startingLine
+                            endingLine
+                            age
+                        }
+                    }
+                    blame1: blame(path: $path_0_0_1) {
+                        ranges {
+                            commit {
+                                oid
+                                author {
+                                    name
+                                    email
+                                }
+                                message
+                                committedDate
+                            }
+                            startingLine
+                            endingLine
+                            age
+                        }
+                    }
+                }
+            }
+        }
+    }
+}"""
+
+EXPECTED_BLAME_QUERY_MULTIPLE_REPOS = """query ($repo_name_0: String!, $repo_owner_0: String!, $ref_0_0: String!, $path_0_0_0: String!, $path_0_0_1: String!, $repo_name_1: String!, $repo_owner_1: String!, $ref_1_0: String!, $path_1_0_0: String!) {
+    repository0: repository(name: $repo_name_0, owner: $repo_owner_0) {
+        ref0: ref(qualifiedName: $ref_0_0) {
+            target {
+                ... on Commit {
+                    blame0: blame(path: $path_0_0_0) {
+                        ranges {
+                            commit {
+                                oid
+                                author {
+                                    name
+                                    email
+                                }
+                                message
+                                committedDate
+                            }
+                            startingLine
+                            endingLine
+                            age
+                        }
+                    }
+                    blame1: blame(path: $path_0_0_1) {
+                        ranges {
+                            commit {
+                                oid
+                                author {
+                                    name
+                                    email
+                                }
+                                message
+                                committedDate
+                            }
+                            startingLine
+                            endingLine
+                            age
+                        }
+                    }
+                }
+            }
+        }
+    }
+    repository1: repository(name: $repo_name_1, owner: $repo_owner_1) {
+        ref0: ref(qualifiedName: $ref_1_0) {
+            target {
+                ... on Commit {
+                    blame0: blame(path: $path_1_0_0) {
+                        ranges {
+                            commit {
+                                oid
+                                author {
+                                    name
+                                    email
+                                }
+                                message
+                                committedDate
+                            }
+                            startingLine
+                            endingLine
+                            age
+                        }
+                    }
+                }
+            }
+        }
+    }
+}"""
+
+EXPECTED_BLAME_QUERY_MULTIPLE_REFS = """query ($repo_name_0: String!, $repo_owner_0: String!, $ref_0_0: String!, $path_0_0_0: String!, $ref_0_1: String!, $path_0_1_0: String!) {
+    repository0: repository(name: $repo_name_0, owner: $repo_owner_0) {
+        ref0: ref(qualifiedName: $ref_0_0) {
+            target {
+                ... on Commit {
+                    blame0: blame(path: $path_0_0_0) {
+                        ranges {
+                            commit {
+                                oid
+                                author {
+                                    name
+                                    email
+                                }
+                                message
+                                committedDate
+                            }
+                            startingLine
+                            endingLine
+                            age
+                        }
+                    }
+                }
+            }
+        }
+        ref1: ref(qualifiedName: $ref_0_1) {
+            target {
+                ... on Commit {
+                    blame0: blame(path: $path_0_1_0) {
+                        ranges {
+                            commit {
+                                oid
+                                author {
+                                    name
+                                    email
+                                }
+                                message
+                                committedDate
+                            }
+                            startingLine
+                            endingLine
+                            age
+                        }
+                    }
+                }
+            }
+        }
+    }
+}"""
+
+EXPECTED_BLAME_QUERY_TRIMMED_PATH = """query ($repo_name_0: String!, $repo_owner_0: String!, $ref_0_0: String!, $path_0_0_0: String!) {
+    repository0: repository(name: $repo_name_0, owner: $repo_owner_0) {
+        ref0: ref(qualifiedName: $ref_0_0) {
+            target {
+                ... on Commit {
+                    blame0: blame(path: $path_0_0_0) {
+                        ranges {
+                            commit {
+                                oid
+                                author {
+                                    name
+                                    email
+                                }
+                                message
+                                committedDate
+                            }
+                            startingLine
+                            endingLine
+                            age
+                        }
+                    }
+                }
+            }
+        }
+    }
+}"""
+
 
 class GitHubApiClientTest(TestCase):
     @mock.patch("sentry.integrations.github.client.get_jwt", return_value="jwt_token_1")
@@ -852,48 +1040,7 @@ class GitHubClientFileBlameQueryBuilderTest(GitHubClientFileBlameBase):
             repo=self.repo_1,
             code_mapping=None,  # type: ignore[arg-type]
         )
-        query = """query ($repo_name_0: String!, $repo_owner_0: String!, $ref_0_0: String!, $path_0_0_0: String!, $path_0_0_1: String!) {
-    repository0: repository(name: $repo_name_0, owner: $repo_owner_0) {
-        ref0: ref(qualifiedName: $ref_0_0) {
-            target {
-                ... on Commit {
-                    blame0: blame(path: $path_0_0_0) {
-                        ranges {
-                            commit {
-                                oid
-                                author {
-                                    name
-                                    email
-                                }
-                                message
-                                committedDate
-                            }
-                            startingLine
-                            endingLine
-                            age
-                        }
-                    }
-                    blame1: blame(path: $path_0_0_1) {
-                        ranges {
-                            commit {
-                                oid
-                                author {
-                                    name
-                                    email
-                                }
-                                message
-                                committedDate
-                            }
-                            startingLine
-                            endingLine
-                            age
-                        }
-                    }
-                }
-            }
-        }
-    }
-}"""
+        query = EXPECTED_BLAME_QUERY_SINGLE_REPO
         responses.add(
             method=responses.POST,
             url="https://api.github.com/graphql",
@@ -942,72 +1089,7 @@ class GitHubClientFileBlameQueryBuilderTest(GitHubClientFileBlameBase):
             repo=self.repo_2,
             code_mapping=None,  # type: ignore[arg-type]
         )
-        query = """query ($repo_name_0: String!, $repo_owner_0: String!, $ref_0_0: String!, $path_0_0_0: String!, $path_0_0_1: String!, $repo_name_1: String!, $repo_owner_1: String!, $ref_1_0: String!, $path_1_0_0: String!) {
-    repository0: repository(name: $repo_name_0, owner: $repo_owner_0) {
-        ref0: ref(qualifiedName: $ref_0_0) {
-            target {
-                ... on Commit {
-                    blame0: blame(path: $path_0_0_0) {
-                        ranges {
-                            commit {
-                                oid
-                                author {
-                                    name
-                                    email
-                                }
-                                message
-                                committedDate
-                            }
-                            startingLine
-                            endingLine
-                            age
-                        }
-                    }
-                    blame1: blame(path: $path_0_0_1) {
-                        ranges {
-                            commit {
-                                oid
-                                author {
-                                    name
-                                    email
-                                }
-                                message
-                                committedDate
-                            }
-                            startingLine
-                            endingLine
-                            age
-                        }
-                    }
-                }
-            }
-        }
-    }
-    repository1: repository(name: $repo_name_1, owner: $repo_owner_1) {
-        ref0: ref(qualifiedName: $ref_1_0) {
-            target {
-                ... on Commit {
-                    blame0: blame(path: $path_1_0_0) {
-                        ranges {
-                            commit {
-                                oid
-                                author {
-                                    name
-                                    email
-                                }
-                                message
-                                committedDate
-                            }
-                            startingLine
-                            endingLine
-                            age
-                        }
-                    }
-                }
-            }
-        }
-    }
-}"""
+        query = EXPECTED_BLAME_QUERY_MULTIPLE_REPOS
         responses.add(
             method=responses.POST,
             url="https://api.github.com/graphql",
@@ -1060,54 +1142,7 @@ class GitHubClientFileBlameQueryBuilderTest(GitHubClientFileBlameBase):
             repo=self.repo_1,
             code_mapping=None,  # type: ignore[arg-type]
         )
-        query = """query ($repo_name_0: String!, $repo_owner_0: String!, $ref_0_0: String!, $path_0_0_0: String!, $ref_0_1: String!, $path_0_1_0: String!) {
-    repository0: repository(name: $repo_name_0, owner: $repo_owner_0) {
-        ref0: ref(qualifiedName: $ref_0_0) {
-            target {
-                ... on Commit {
-                    blame0: blame(path: $path_0_0_0) {
-                        ranges {
-                            commit {
-                                oid
-                                author {
-                                    name
-                                    email
-                                }
-                                message
-                                committedDate
-                            }
-                            startingLine
-                            endingLine
-                            age
-                        }
-                    }
-                }
-            }
-        }
-        ref1: ref(qualifiedName: $ref_0_1) {
-            target {
-                ... on Commit {
-                    blame0: blame(path: $path_0_1_0) {
-                        ranges {
-                            commit {
-                                oid
-                                author {
-                                    name
-                                    email
-                                }
-                                message
-                                committedDate
-                            }
-                            startingLine
-                            endingLine
-                            age
-                        }
-                    }
-                }
-            }
-        }
-    }
-}"""
+        query = EXPECTED_BLAME_QUERY_MULTIPLE_REFS
         responses.add(
             method=responses.POST,
             url="https://api.github.com/graphql",
@@ -1144,32 +1179,7 @@ class GitHubClientFileBlameQueryBuilderTest(GitHubClientFileBlameBase):
             code_mapping=None,  # type: ignore[arg-type]
         )
 
-        query = """query ($repo_name_0: String!, $repo_owner_0: String!, $ref_0_0: String!, $path_0_0_0: String!) {
-    repository0: repository(name: $repo_name_0, owner: $repo_owner_0) {
-        ref0: ref(qualifiedName: $ref_0_0) {
-            target {
-                ... on Commit {
-                    blame0: blame(path: $path_0_0_0) {
-                        ranges {
-                            commit {
-                                oid
-                                author {
-                                    name
-                                    email
-                                }
-                                message
-                                committedDate
-                            }
-                            startingLine
-                            endingLine
-                            age
-                        }
-                    }
-                }
-            }
-        }
-    }
-}"""
+        query = EXPECTED_BLAME_QUERY_TRIMMED_PATH
         responses.add(
             method=responses.POST,
             url="https://api.github.com/graphql",
@@ -21,6 +21,25 @@ from sentry.testutils.helpers.integrations import get_installation_of_type
 from sentry.testutils.silo import assume_test_silo_mode, control_silo_test
 from sentry.users.models.identity import Identity, IdentityProvider, IdentityStatus
 
+ACCESS_TOKEN = "xxxxx-xxxxxxxxx-xxxxxxxxxx-xxxxxxxxxxxx"
+BASE_URL = "https://github.example.org/api/v3"
+
+# Static request payloads shared by assert_setup_flow and the API-response helper,
+# hoisted so they aren't rebuilt for every test.
+INSTALLATION_TOKEN_URL = BASE_URL + "/app/installations/{installation_id}/access_tokens"
+INSTALLATION_TOKEN_JSON = {"token": ACCESS_TOKEN, "expires_at": "3000-01-01T00:00:00Z"}
+RATE_LIMIT_URL = BASE_URL + "/rate_limit"
+RATE_LIMIT_JSON = {
+    "resources": {
+        "graphql": {
+            "limit": 5000,
+            "used": 1,
+            "remaining": 4999,
+            "reset": 1613064000,
+        }
+    }
+}
+
 
 @control_silo_test
 class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
@@ -35,14 +54,13 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
         "private_key": "private_key",
         "verify_ssl": True,
     }
-    base_url = "https://github.example.org/api/v3"
+    base_url = BASE_URL
 
     @patch("sentry.integrations.github_enterprise.integration.get_jwt", return_value="jwt_token_1")
     @patch("sentry.integrations.github.client.get_jwt", return_value="jwt_token_1")
     def assert_setup_flow(
         self, get_jwt, _, installation_id="install_id_1", app_id="app_1", user_id="user_id_1"
     ):
-        responses.reset()
         resp = self.client.get(self.init_path)
         assert resp.status_code == 200
         resp = self.client.post(self.init_path, data=self.config)
@@ -72,18 +90,16 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
         # easier
         authorize_params = {k: v[0] for k, v in params.items()}
 
-        access_token = "xxxxx-xxxxxxxxx-xxxxxxxxxx-xxxxxxxxxxxx"
-
         responses.add(
             responses.POST,
             "https://github.example.org/login/oauth/access_token",
-            json={"access_token": access_token},
+            json={"access_token": ACCESS_TOKEN},
         )
 
         responses.add(
             responses.POST,
-            self.base_url + f"/app/installations/{installation_id}/access_tokens",
-            json={"token": access_token, "expires_at": "3000-01-01T00:00:00Z"},
+            INSTALLATION_TOKEN_URL.format(installation_id=installation_id),
+            json=INSTALLATION_TOKEN_JSON,
         )
 
         responses.add(responses.GET, self.base_url + "/user", json={"id": user_id})
@@ -111,17 +127,8 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
 
         responses.add(
             method=responses.GET,
-            url=self.base_url + "/rate_limit",
-            json={
-                "resources": {
-                    "graphql": {
-                        "limit": 5000,
-                        "used": 1,
-                        "remaining": 4999,
-                        "reset": 1613064000,
-                    }
-                }
-            },
+            url=RATE_LIMIT_URL,
+            json=RATE_LIMIT_JSON,
             status=200,
             content_type="application/json",
         )
@@ -150,6 +157,63 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
 
         self.assertDialogSuccess(resp)
 
+    def create_github_enterprise_integration(self):
+        """
+        Integration fixture matching what assert_setup_flow installs, without replaying the
+        whole OAuth dance per test; the flow itself is covered by test_basic_flow.
+        """
+        return self.create_integration(
+            organization=self.organization,
+            external_id="github.example.org:install_id_1",
+            provider="github_enterprise",
+            name="Test Organization",
+            metadata={
+                "access_token": None,
+                "expires_at": None,
+                "icon": "https://github.example.org/avatar.png",
+                "domain_name": "github.example.org/Test-Organization",
+                "account_type": "Organization",
+                "installation_id": "install_id_1",
+                "installation": {
+                    "client_id": "client_id",
+                    "client_secret": "client_secret",
+                    "id": "2",
+                    "name": "test-app",
+                    "private_key": "private_key",
+                    "url": "github.example.org",
+                    "webhook_secret": "webhook_secret",
+                    "verify_ssl": True,
+                },
+            },
+        )
+
+    def create_github_enterprise_repo(self, integration):
+        with assume_test_silo_mode(SiloMode.REGION):
+            return Repository.objects.create(
+                organization_id=self.organization.id,
+                name="Test-Organization/foo",
+                url="https://github.example.org/Test-Organization/foo",
+                provider="integrations:github_enterprise",
+                external_id=123,
+                config={"name": "Test-Organization/foo"},
+                integration_id=integration.id,
+            )
+
+    def add_github_api_responses(self, installation_id="install_id_1"):
+        """Registers the responses the client needs to authenticate outside the setup flow."""
+        responses.add(
+            responses.POST,
+            INSTALLATION_TOKEN_URL.format(installation_id=installation_id),
+            json=INSTALLATION_TOKEN_JSON,
+        )
+        responses.add(
+            method=responses.GET,
+            url=RATE_LIMIT_URL,
+            json=RATE_LIMIT_JSON,
+            status=200,
+            content_type="application/json",
+        )
+
     @responses.activate
     def test_basic_flow(self):
         self.assert_setup_flow()
@@ -190,8 +254,8 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
     @patch("sentry.integrations.github_enterprise.client.get_jwt", return_value="jwt_token_1")
     @responses.activate
     def test_get_repositories_search_param(self, mock_jwtm, _):
-        with self.tasks():
-            self.assert_setup_flow()
+        integration = self.create_github_enterprise_integration()
+        self.add_github_api_responses()
 
         querystring = urlencode({"q": "org:Test Organization ex"})
         responses.add(
@@ -204,7 +268,6 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
                 ]
             },
         )
-        integration = Integration.objects.get(provider=self.provider.key)
         installation = get_installation_of_type(
             GitHubEnterpriseIntegration, integration, self.organization.id
         )
@@ -218,19 +281,10 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
     @patch("sentry.integrations.github_enterprise.client.get_jwt", return_value="jwt_token_1")
     @responses.activate
     def test_get_stacktrace_link_file_exists(self, get_jwt, _):
-        self.assert_setup_flow()
-        integration = Integration.objects.get(provider=self.provider.key)
+        integration = self.create_github_enterprise_integration()
+        self.add_github_api_responses()
 
-        with assume_test_silo_mode(SiloMode.REGION):
-            repo = Repository.objects.create(
-                organization_id=self.organization.id,
-                name="Test-Organization/foo",
-                url="https://github.example.org/Test-Organization/foo",
-                provider="integrations:github_enterprise",
-                external_id=123,
-                config={"name": "Test-Organization/foo"},
-                integration_id=integration.id,
-            )
+        repo = self.create_github_enterprise_repo(integration)
 
         path = "README.md"
         version = "1234567"
@@ -250,19 +304,10 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
     @patch("sentry.integrations.github_enterprise.client.get_jwt", return_value="jwt_token_1")
     @responses.activate
     def test_get_stacktrace_link_file_doesnt_exists(self, get_jwt, _):
-        self.assert_setup_flow()
-        integration = Integration.objects.get(provider=self.provider.key)
+        integration = self.create_github_enterprise_integration()
+        self.add_github_api_responses()
 
-        with assume_test_silo_mode(SiloMode.REGION):
-            repo = Repository.objects.create(
-                organization_id=self.organization.id,
-                name="Test-Organization/foo",
-                url="https://github.example.org/Test-Organization/foo",
-                provider="integrations:github_enterprise",
-                external_id=123,
-                config={"name": "Test-Organization/foo"},
-                integration_id=integration.id,
-            )
+        repo = self.create_github_enterprise_repo(integration)
         path = "README.md"
         version = "master"
         default = "master"
@@ -282,19 +327,10 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
     @patch("sentry.integrations.github_enterprise.client.get_jwt", return_value="jwt_token_1")
     @responses.activate
     def test_get_stacktrace_link_no_org_integration(self, get_jwt, _):
-        self.assert_setup_flow()
-        integration = Integration.objects.get(provider=self.provider.key)
+        integration = self.create_github_enterprise_integration()
+        self.add_github_api_responses()
 
-        with assume_test_silo_mode(SiloMode.REGION):
-            repo = Repository.objects.create(
-                organization_id=self.organization.id,
-                name="Test-Organization/foo",
-                url="https://github.example.org/Test-Organization/foo",
-                provider="integrations:github_enterprise",
-                external_id=123,
-                config={"name": "Test-Organization/foo"},
-                integration_id=integration.id,
-            )
+        repo = self.create_github_enterprise_repo(integration)
         path = "README.md"
         version = "master"
         default = "master"
@@ -317,19 +353,10 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
     @patch("sentry.integrations.github_enterprise.client.get_jwt", return_value="jwt_token_1")
     @responses.activate
     def test_get_stacktrace_link_use_default_if_version_404(self, get_jwt, _):
-        self.assert_setup_flow()
-        integration = Integration.objects.get(provider=self.provider.key)
+        integration = self.create_github_enterprise_integration()
+        self.add_github_api_responses()
 
-        with assume_test_silo_mode(SiloMode.REGION):
-            repo = Repository.objects.create(
-                organization_id=self.organization.id,
-                name="Test-Organization/foo",
-                url="https://github.example.org/Test-Organization/foo",
-                provider="integrations:github_enterprise",
-                external_id=123,
-                config={"name": "Test-Organization/foo"},
-                integration_id=integration.id,
-            )
+        repo = self.create_github_enterprise_repo(integration)
         path = "README.md"
         version = "12345678"
         default = "master"
@@ -353,18 +380,9 @@ class GitHubEnterpriseIntegrationTest(IntegrationTestCase):
     @patch("sentry.integrations.github_enterprise.client.get_jwt", return_value="jwt_token_1")
     @responses.activate
     def test_get_commit_context_all_frames(self, _, __):
-        self.assert_setup_flow()
-        integration = Integration.objects.get(provider=self.provider.key)
-        with assume_test_silo_mode(SiloMode.REGION):
-            repo = Repository.objects.create(
-                organization_id=self.organization.id,
-                name="Test-Organization/foo",
-                url="https://github.example.org/Test-Organization/foo",
-                provider="integrations:github_enterprise",
-                external_id=123,
-                config={"name": "Test-Organization/foo"},
-                integration_id=integration.id,
-            )
+        integration = self.create_github_enterprise_integration()
+        self.add_github_api_responses()
+        repo = self.create_github_enterprise_repo(integration)
         installation = get_installation_of_type(
             GitHubEnterpriseIntegration, integration, self.organization.id
         )
@@ -10,6 +10,7 @@ from sentry.issues.issue_velocity import (
     STALE_DATE_KEY,
     THRESHOLD_KEY,
     TIME_TO_USE_EXISTING_THRESHOLD,
+    _local_threshold_cache,
     calculate_threshold,
     fallback_to_stale_or_zero,
     get_latest_threshold,
@@ -28,6 +29,7 @@ class IssueVelocityTests(TestCase, SnubaTestCase):
     def setUp(self) -> None:
         self.now = timezone.now()
         self.utcnow = datetime.utcnow()
+        _local_threshold_cache.clear()
         super().setUp()
 
     def test_calculation_simple(self) -> None:
@@ -0,0 +1,53 @@
+from sentry.models.grouphashmetadata import GroupHashMetadata
+from sentry.testutils.cases import TestMigrations
+
+
+class BackfillGroupHashMetadataGroupTest(TestMigrations):
+    migrate_from = "0753_grouphashmetadata_add_group"
+    migrate_to = "0754_backfill_grouphashmetadata_group"
+
+    def setup_before_migration(self, apps):
+        Organization = apps.get_model("sentry", "Organization")
+        Project = apps.get_model("sentry", "Project")
+        Group = apps.get_model("sentry", "Group")
+        GroupHash = apps.get_model("sentry", "GroupHash")
+        GroupHashMetadata = apps.get_model("sentry", "GroupHashMetadata")
+
+        organization = Organization.objects.create(name="test", slug="test")
+        project = Project.objects.create(organization=organization, name="test", slug="test")
+        self.group_id = Group.objects.create(project=project).id
+        self.other_group_id = Group.objects.create(project=project).id
+
+        # Already in sync - should be left alone
+        in_sync_grouphash = GroupHash.objects.create(
+            project=project, hash="a" * 32, group_id=self.group_id
+        )
+        self.in_sync_id = GroupHashMetadata.objects.create(
+            grouphash=in_sync_grouphash, group_id=self.group_id
+        ).id
+
+        # Not yet backfilled
+        missing_grouphash = GroupHash.objects.create(
+            project=project, hash="b" * 32, group_id=self.group_id
+        )
+        self.missing_id = GroupHashMetadata.objects.create(grouphash=missing_grouphash).id
+
+        # Stale - points at the wrong group
+        stale_grouphash = GroupHash.objects.create(
+            project=project, hash="c" * 32, group_id=self.group_id
+        )
+        self.stale_id = GroupHashMetadata.objects.create(
+            grouphash=stale_grouphash, group_id=self.other_group_id
+        ).id
+
+        # Hash with no group - any stale value should be cleared
+        groupless_grouphash = GroupHash.objects.create(project=project, hash="d" * 32)
+        self.groupless_id = GroupHashMetadata.objects.create(
+            grouphash=groupless_grouphash, group_id=self.other_group_id
+        ).id
+
+    def test(self):
+        assert GroupHashMetadata.objects.get(id=self.in_sync_id).group_id == self.group_id
+        assert GroupHashMetadata.objects.get(id=self.missing_id).group_id == self.group_id
+        assert GroupHashMetadata.objects.get(id=self.stale_id).group_id == self.group_id
+        assert GroupHashMetadata.objects.get(id=self.groupless_id).group_id is None
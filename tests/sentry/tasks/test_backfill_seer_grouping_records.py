@@ -39,7 +39,6 @@ from sentry.testutils.helpers.features import with_feature
 from sentry.testutils.helpers.options import override_options
 from sentry.testutils.helpers.task_runner import TaskRunner
 from sentry.testutils.pytest.fixtures import django_db_all
-from sentry.utils import json
 from sentry.utils.safe import get_path
 from sentry.utils.snuba import RateLimitExceeded, bulk_snuba_queries
 
@@ -1475,7 +1474,7 @@ class TestBackfillSeerGroupingRecords(SnubaTestCase, TestCase):
             "tasks.backfill_seer_grouping_records.no_data",
             extra={
                 "project_id": self.project.id,
-                "group_id_batch": json.dumps(group_ids_sorted),
+                "group_id_batch": group_ids_sorted,
             },
         )
         mock_call_next_backfill.assert_called_with(